@@ -16,7 +16,7 @@ Uple: Latin adjectives describing n-sized groups
 Examples
 --------
 Get a keyword by encoding a number in a particular category:
->>> encode(1, "ordinal")
+>>> encode(1, "cardinal")
 'one'
 >>> encode(2, "tonal")
 'ditonic'
@@ -61,8 +61,9 @@ __all__ = [
     'encode', 
     'polyad', 
     'tonal', 
-    'basal', 
-    'cardinal', 
+    'basal',
+    'cardinal',
+    'ordinal',
     'uple'
 ]
 
@@ -97,6 +98,28 @@ __table = [
         'fifteen', 'fifteenth', 'quindecuple']
 ]
 
+# Reverse map and column indices, built once at import so that decode() is a
+# single dict lookup instead of a scan of the whole table.
+__keywords = {word: i for i, row in enumerate(__table[1:], start=1)
+              for word in row}
+__columns = {name: i for i, name in enumerate(__table[0])}
+
+# Fixed column indices let the shortcut functions index the table directly
+# instead of going through encode()'s category lookup.
+__POLYAD_COL = 0
+__TONAL_COL = 1
+__BASAL_COL = 2
+__CARDINAL_COL = 3
+__ORDINAL_COL = 4
+__UPLE_COL = 5
+
+
+def __row(number: int) -> list[str]:
+    '''Return the table row for the given number, or raise ValueError.'''
+    if not 1 <= number < len(__table):
+        raise ValueError(f"Cannot encode number: {number}")
+    return __table[number]
+
 
 def columns() -> list[str]:
     '''Return the headings of the table.'''
@@ -109,42 +132,43 @@ def rows() -> list[list[str]]:
 
 def decode(keyword: str) -> int:
     '''Return the number represented by the given keyword.'''
-    for i, row in enumerate(__table):
-        for word in row:
-            if keyword == word:
-                return i
-    raise ValueError(f"Unknown keyword: {keyword}")
-
-def encode(category: str, number: int) -> str:
-    '''Return the keyword that represents the given number in the given 
+    try:
+        return __keywords[keyword]
+    except KeyError:
+        raise ValueError(f"Unknown keyword: {keyword}") from None
+
+def encode(number: int, category: str) -> str:
+    '''Return the keyword that represents the given number in the given
     category.
     '''
-    if not category in columns():
+    if not category in __columns:
         raise ValueError(f"Unknown category: {category}")
-    if not number in range(1, len(__table)):
-        raise ValueError(f"Cannot encode number: {number}")
-    i = columns().index(category)
-    return __table[number][i]
+    return __row(number)[__columns[category]]
 
 def polyad(number: int) -> str:
     '''Return the polyad keyword for the given number.'''
-    return encode("polyad", number)
+    return __row(number)[__POLYAD_COL]
 
 
 def tonal(number: int) -> str:
     '''Return the tonal keyword for the given number.'''
-    return encode("tonal", number)
+    return __row(number)[__TONAL_COL]
 
 def basal(number: int) -> str:
     '''Return the basal keyword for the given number.'''
-    return encode("basal", number)
+    return __row(number)[__BASAL_COL]
 
 
 def cardinal(number: int) -> str:
     '''Return the cardinal keyword for the given number.'''
-    return encode("cardinal", number)
+    return __row(number)[__CARDINAL_COL]
+
+
+def ordinal(number: int) -> str:
+    '''Return the ordinal keyword for the given number.'''
+    return __row(number)[__ORDINAL_COL]
 
 
 def uple(number: int) -> str:
     '''Return the -uple keyword for the given number.'''
-    return encode("uple", number)
+    return __row(number)[__UPLE_COL]
@@ -49,6 +49,8 @@ comprehensions, but my linter is happy:
 [{'number-one': 1}, {'number-two': 2}, {'number-ten': 10}, {'number-twenty': 20}]
 """
 import re
+from functools import lru_cache
+from typing import Iterable
 
 ACRONYM_RE = re.compile(r"([A-Z\d]+)(?=[A-Z\d]|$)")
 PASCAL_RE = re.compile(r"([^\-_]+)")
@@ -56,7 +58,34 @@ SPLIT_RE = re.compile(r"([\-_]*[A-Z][^A-Z]*[\-_]*)")
 # SPLIT_RE = re.compile(r"([\-_]*(?<=[^0-9])(?=[A-Z]+)[^A-Z]*[\-_]*)")
 UNDERSCORE_RE = re.compile(r"(?<=[^\-_])[\-_]+[^\-_]")
 
+# Anchored patterns for the is_* predicates. Each matches a subset of
+# strings that are certainly in the given case, so the predicates can
+# answer with a single scan; anything else falls back to the full
+# convert-and-compare round trip.
+_SNAKE_CASE_RE = re.compile(r"[a-z0-9_]*\Z")
+_KEBAB_CASE_RE = re.compile(r"[a-z0-9]*(?:-[a-z0-9]+)*\Z")
+_CAMEL_CASE_RE = re.compile(r"[a-z][A-Za-z0-9]*\Z")
+_PASCAL_CASE_RE = re.compile(r"[A-Z][A-Za-z0-9]*\Z")
 
+
+def _upper_after_separator(match: re.Match[str]) -> str:
+    return match.group(0)[-1].upper()
+
+
+def _dash_before_char(match: re.Match[str]) -> str:
+    return "-" + match.group(0)[-1]
+
+
+def _capitalize_fragment(match: re.Match[str]) -> str:
+    fragment = match.group(1)
+    return fragment[0].upper() + fragment[1:]
+
+
+def _titlecase_run(match: re.Match[str]) -> str:
+    return match.group(0).title()
+
+
+@lru_cache(maxsize=1024)
 def pascalize(string: str) -> str:
     '''
     Convert a string to pascal case.
@@ -106,13 +135,11 @@ def pascalize(string: str) -> str:
     if s.isupper() or s.isnumeric():
         return string
 
-    def _replace_fn(match: re.Match[str]):
-        return match.group(1)[0].upper() + match.group(1)[1:]
-
-    s = camelize(PASCAL_RE.sub(_replace_fn, s))
+    s = camelize(PASCAL_RE.sub(_capitalize_fragment, s))
     return s[0].upper() + s[1:] if len(s) != 0 else s
 
 
+@lru_cache(maxsize=1024)
 def camelize(string: str) -> str:
     """
     Convert a string to camel case.
@@ -173,11 +200,17 @@ def camelize(string: str) -> str:
     if len(s) != 0 and not s[:2].isupper():
         s = s[0].lower() + s[1:]
 
+    # Skip the regex entirely when there is no separator to collapse,
+    # which is the common case for keys that are already camel case.
+    if "_" not in s and "-" not in s:
+        return s
+
     # For string "hello_world", match will contain
     #             the regex capture group for "_w".
-    return UNDERSCORE_RE.sub(lambda m: m.group(0)[-1].upper(), s)
+    return UNDERSCORE_RE.sub(_upper_after_separator, s)
 
 
+@lru_cache(maxsize=1024)
 def kebabize(string: str) -> str:
     """
     Convert a string to kebab case.
@@ -231,9 +264,12 @@ def kebabize(string: str) -> str:
             ).lower()
         )
 
-    return UNDERSCORE_RE.sub(lambda m: "-" + m.group(0)[-1], s)
+    if "_" not in s and "-" not in s:
+        return s
+    return UNDERSCORE_RE.sub(_dash_before_char, s)
 
 
+@lru_cache(maxsize=1024)
 def decamelize(string: str) -> str:
     """
     Convert a string to snake case.
@@ -292,10 +328,55 @@ def decamelize(string: str) -> str:
     s = _ensure_str(string)
     if s.isupper() or s.isnumeric():
         return string
+    if s.islower():
+        # No case boundary to separate and nothing to lower.
+        return s
 
     return _separate_words(_fix_abbreviations(s)).lower()
 
 
+def decamelize_many(strings: Iterable[str]) -> list[str]:
+    """
+    Convert an iterable of strings to snake case in one call.
+
+    This is the bulk counterpart of ``decamelize`` for workloads such as
+    renaming every key in a large table: the pipeline stages are bound
+    once outside the loop, so each string skips the per-call dispatch
+    overhead of the single-string function.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        Strings to convert.
+
+    Returns
+    -------
+    list[str]
+        The converted strings, in input order.
+
+    Examples
+    --------
+    >>> decamelize_many(['lastPrice', 'APIResponse', 'symbol', 'memMB'])
+    ['last_price', 'api_response', 'symbol', 'mem_mb']
+    """
+    ensure = _ensure_str
+    fix = _fix_abbreviations
+    separate = _separate_words
+    result: list[str] = []
+    append = result.append
+    for string in strings:
+        s = ensure(string)
+        if s.isupper() or s.isnumeric():
+            append(string)
+        elif s.islower():
+            # Nothing to separate and nothing to lower.
+            append(s)
+        else:
+            append(separate(fix(s)).lower())
+    return result
+
+
+@lru_cache(maxsize=1024)
 def depascalize(string: str) -> str:
     """
     Convert a string to snake case.
@@ -313,6 +394,7 @@ def depascalize(string: str) -> str:
     return decamelize(string)
 
 
+@lru_cache(maxsize=1024)
 def dekebabize(string: str) -> str:
     """
     Convert a string to snake case.
@@ -381,6 +463,8 @@ def is_camelcase(string: str) -> bool:
     bool
         True, if the string is in camel case.
     '''
+    if _CAMEL_CASE_RE.match(string):
+        return True
     return string == camelize(string)
 
 
@@ -398,6 +482,8 @@ def is_pascalcase(string: str) -> bool:
     bool
         True, if the string is in pascal case.
     '''
+    if _PASCAL_CASE_RE.match(string):
+        return True
     return string == pascalize(string)
 
 
@@ -415,6 +501,8 @@ def is_kebabcase(string: str) -> bool:
     bool
         True, if the string is in kebab case.
     """
+    if _KEBAB_CASE_RE.match(string):
+        return True
     return string == kebabize(string)
 
 
@@ -432,6 +520,8 @@ def is_snakecase(string: str) -> bool:
     bool
         True, if the string is in snake case.
     """
+    if _SNAKE_CASE_RE.match(string):
+        return True
     if is_kebabcase(string) and not is_camelcase(string):
         return False
 
@@ -453,7 +543,12 @@ def _ensure_str(_in: str | None) -> str:
     str
         An empty string, or the original string stripped of whitespace.
     '''
-    return "" if _in is None else re.sub(r"\s+", "", str(_in))
+    if _in is None:
+        return ""
+    # str.split with no argument splits on (and discards) any whitespace,
+    # so this is a regex-free single pass; join of a one-element list is
+    # free, which is the common no-whitespace case.
+    return "".join(str(_in).split())
 
 def _fix_abbreviations(string: str) -> str:
     '''
@@ -491,7 +586,11 @@ def _fix_abbreviations(string: str) -> str:
     >>> decamelize('B52Thing')
     'b52_thing'
     '''
-    return ACRONYM_RE.sub(lambda m: m.group(0).title(), string)
+    # Without an uppercase letter the acronym pattern can only match
+    # digit runs, which title() leaves alone, so skip the engine.
+    if string.islower() or string.isnumeric():
+        return string
+    return ACRONYM_RE.sub(_titlecase_run, string)
 
 
 def _separate_words(string: str, separator: str="_") -> str:
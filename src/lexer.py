@@ -60,9 +60,19 @@ Token(DELIMITER, ), 5[35])
 '''
 from __future__ import annotations
 import re
-from typing import Any, Callable, Optional, Sequence
+from array import array
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Sequence
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 NEWLINE = "\n"
+LONGEST = "longest"
+FIRST = "first"
+RE = "re"
+HYPERSCAN = "hyperscan"
 
 class UnknownSymbolError(Exception):
     '''Error signifying that the lexer could not parse the symbol at the
@@ -73,35 +83,75 @@ class UnknownSymbolError(Exception):
         errmsg = f"""Unable to parse symbol at position {col} on line {line}.\n\tNear here:\n\t\t{excerpt}\n\t\t{diagram}"""
         super().__init__(errmsg)
 
-class Token:
+class Token(NamedTuple):
     '''
     The lexical category to which a text segment belongs, as well as
     its location in the source text, both literally and when newlines are
     considered.
     '''
-    __slots__ = "token_type", "lexeme", "start", "end", "line", "column"
-
-    def __init__(self,
-                 token_type: str,
-                 lexeme: Any,
-                 start: int,
-                 end: int,
-                 line: int,
-                 column: int
-                 ) -> None:
-        self.token_type = token_type
-        self.lexeme = lexeme
-        self.start = start
-        self.end = end
-        self.line = line
-        self.column = column
+    token_type: str
+    lexeme: Any
+    start: int
+    end: int
+    line: int
+    column: int
 
     def __repr__(self) -> str:
         return f"Token({self.token_type}, {self.lexeme}, {self.line}[{self.column}])"
-    
+
     def __len__(self) -> int:
         return len(str(self.lexeme))
 
+class TokenList:
+    '''
+    Token storage laid out as parallel arrays (structure of arrays).
+
+    Instead of one Token object per lexeme, the list keeps one sequence per
+    Token field: the integer fields live in compact typed arrays and only
+    the types and lexemes are Python objects. Appending a token is six
+    C-level appends rather than an object allocation, and a very large
+    source therefore costs far less memory. ``Token`` views are built on
+    demand when an entry is indexed or iterated.
+    '''
+    __slots__ = "token_types", "lexemes", "starts", "ends", "lines", "columns"
+
+    def __init__(self) -> None:
+        self.token_types: list[str] = []
+        self.lexemes: list[Any] = []
+        self.starts = array("q")
+        self.ends = array("q")
+        self.lines = array("q")
+        self.columns = array("q")
+
+    def append(self,
+               token_type: str,
+               lexeme: Any,
+               start: int,
+               end: int,
+               line: int,
+               column: int
+               ) -> None:
+        '''Append one token's fields to the parallel arrays.'''
+        self.token_types.append(token_type)
+        self.lexemes.append(lexeme)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self) -> int:
+        return len(self.token_types)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(self.token_types[index], self.lexemes[index],
+                     self.starts[index], self.ends[index],
+                     self.lines[index], self.columns[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.token_types)):
+            yield self[index]
+
+
 class TokenTemplate:
     '''
     The formula for generating a token.
@@ -145,10 +195,10 @@ class TokenTemplate:
             return None
         end = matched.end()
         value = matched.group()
-        for char in value:
-            if char == NEWLINE:
-                line += 1
-                column = 1
+        newlines = value.count(NEWLINE)
+        if newlines:
+            line += newlines
+            column = 1
         if self.callback:
             value = self.callback(value)
         return Token(self.token_type, value, start, end, line, column)
@@ -177,10 +227,8 @@ class ProgramCounter:
     def accept(self, token: Token) -> None:
         '''Accept the given token and adjust the counter according to
         the token's location data.'''
-        if token.line != self.line:
-            self.column = 1
-        else:
-            self.column += token.end - token.start
+        self.column = (1 if token.line != self.line
+                       else self.column + token.end - token.start)
         self.start = token.end
         self.line = token.line
 
@@ -191,40 +239,96 @@ class Lexer:
     The lexer is initialized with a list of [templates]. Then, the ``tokenize``
     method is called on a source text. The lexer crawls through the source
     text and uses the templates to seek matches at the current position.
-    If no match is found, the program crashes. If multiple matches are found,
-    the match with the longest literal is accepted. When a match is accepted,
+    If no match is found, the program crashes. When a match is accepted,
     the program counter moves forward according to the length of the matching
     literal.
+
+    The [strategy] decides what happens when several templates match at the
+    same position. With the default ``"longest"``, the match with the longest
+    literal is accepted, and ties go to the later template. With ``"first"``,
+    the earliest template that matches is accepted immediately, which is
+    cheaper but requires the templates to be ordered from most to least
+    specific (e.g. keywords before identifiers).
+
+    The [engine] selects the regex backend. The default ``"re"`` uses the
+    standard library. ``"hyperscan"`` compiles the templates into a single
+    DFA database via the optional python-hyperscan package, which scans
+    large inputs in one vectorized pass; it supports only the ``"longest"``
+    strategy and ASCII source texts, and the lexer quietly falls back to
+    ``"re"`` when the package is not installed or the text is not ASCII.
     '''
-    __slots__ = "templates", "tokens", "line_counter"
+    __slots__ = ("templates", "tokens", "line_counter", "strategy", "engine",
+                 "__master", "__meta", "__names", "__database")
 
     def __init__(
             self,
-            templates: Sequence[TokenTemplate]
+            templates: Sequence[TokenTemplate],
+            strategy: str = LONGEST,
+            engine: str = RE
             ) -> None:
+        if strategy not in (LONGEST, FIRST):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        if engine not in (RE, HYPERSCAN):
+            raise ValueError(f"Unknown engine: {engine}")
+        if engine == HYPERSCAN and strategy == FIRST:
+            raise ValueError(
+                "The hyperscan engine reports all matches at once and only "
+                "supports the 'longest' strategy.")
+        if engine == HYPERSCAN and hyperscan is None:
+            engine = RE
         self.templates = templates or tuple()
-        self.tokens: list[Token]
+        self.strategy = strategy
+        self.engine = engine
+        self.__database = None
+        if engine == HYPERSCAN:
+            self.__database = hyperscan.Database()
+            self.__database.compile(
+                expressions=[template.regular_expression.pattern.encode()
+                             for template in self.templates],
+                ids=list(range(len(self.templates))),
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self.templates))
+        self.tokens: TokenList
         self.line_counter: ProgramCounter
+        # Combine every template into a single master regex so that each
+        # position in the source is scanned with one C-level call instead of
+        # one call per template. Plain alternation takes the first matching
+        # template, which is exactly what the "first" strategy wants; for
+        # "longest", each template instead becomes an optional lookahead
+        # capture group: the master regex evaluates all of them at the same
+        # position and tokenize() picks the winner from the captured groups.
+        if strategy == FIRST:
+            self.__master = re.compile("|".join(
+                f"(?P<t{i}>{template.regular_expression.pattern})"
+                for i, template in enumerate(self.templates)) or r"(?!)")
+        else:
+            self.__master = re.compile("".join(
+                f"(?:(?=(?P<t{i}>{template.regular_expression.pattern})))?"
+                for i, template in enumerate(self.templates)))
+        group_index = self.__master.groupindex
+        self.__meta = tuple(
+            (group_index[f"t{i}"], template.token_type, template.callback)
+            for i, template in enumerate(self.templates))
+        self.__names = {
+            f"t{i}": (template.token_type, template.callback)
+            for i, template in enumerate(self.templates)}
 
-    def __best(self, best: Token, other: Token) -> Token:
-        # this could be a strategy passed in at runtime...?
-        return best if len(best.lexeme) > len(other.lexeme) else other
-
-    def __accept(self, token: Token) -> None:
-        self.tokens.append(token)
-        self.line_counter.accept(token)
-
-    @property
-    def __start(self) -> int:
-        return self.line_counter.start
+    def __hyperscan_table(self, text: str) -> dict[int, tuple[int, int]]:
+        '''Scan the whole [text] once with the hyperscan database and record,
+        for each start position, the end and template index of the longest
+        match (ties to the later template, as with the "longest" strategy).
+        '''
+        table: dict[int, tuple[int, int]] = {}
 
-    @property
-    def __line(self) -> int:
-        return self.line_counter.line
+        def on_match(identifier: int, start: int, end: int,
+                     flags: int, context: Any = None) -> None:
+            entry = table.get(start)
+            if (entry is None or end > entry[0]
+                    or (end == entry[0] and identifier >= entry[1])):
+                table[start] = (end, identifier)
 
-    @property
-    def __column(self) -> int:
-        return self.line_counter.column
+        self.__database.scan(text.encode("ascii"),
+                             match_event_handler=on_match)
+        return table
 
     def tokenize(self, text: str, filter_types: Optional[Sequence[str]] = None) -> tuple[Token, ...]:
         '''Attempt to sort a source [text] into lexical categories, represented
@@ -235,22 +339,78 @@ class Lexer:
         characters, then you can add them to the a list of [filter_types],
         which will omit tokens with those labels from the final return.
         '''
-        filter_types = filter_types or []
-        self.tokens: list[Token] = []
+        filter_set = frozenset(filter_types or ())
+        self.tokens = TokenList()
         self.line_counter = ProgramCounter()
-        while not self.__start == len(text):
-            best: Optional[Token] = None
-            for template in self.templates:
-                token = template.match(
-                    text, self.__start,  self.__line, self.__column)
-                if not token:
-                    continue
-                if not best:
-                    best = token
-                else:
-                    best = self.__best(best, token)
-            if not best:
-                raise UnknownSymbolError(text, self.__line, self.__column)
-            self.__accept(best)
-        return tuple(x for x in self.tokens if not x.token_type in filter_types)
+        # Bind everything the hot loop touches to locals once; attribute
+        # lookups per position add up on long inputs.
+        counter = self.line_counter
+        accept = self.tokens.append
+        scan = self.__master.match
+        meta = self.__meta
+        names = self.__names
+        templates = self.templates
+        first = self.strategy == FIRST
+        table = None
+        if self.__database is not None and text.isascii():
+            table = self.__hyperscan_table(text)
+        text_length = len(text)
+        while counter.start != text_length:
+            start = counter.start
+            best_end = -1
+            best_type: Optional[str] = None
+            best_callback: Optional[Callable[[str], Any]] = None
+            if table is not None:
+                # All matches were collected in the single up-front scan.
+                entry = table.get(start)
+                if entry is not None:
+                    best_end, index = entry
+                    template = templates[index]
+                    best_type = template.token_type
+                    best_callback = template.callback
+            elif first:
+                # Plain alternation: the engine already took the earliest
+                # matching template, so the winner is just the last group.
+                matched = scan(text, start)
+                if matched:
+                    entry = names.get(matched.lastgroup)
+                    if entry is None:
+                        # A named group inside a template's own pattern can
+                        # shadow lastgroup; sweep the groups to recover.
+                        for group, token_type, callback in meta:
+                            if matched.end(group) != -1:
+                                entry = (token_type, callback)
+                                break
+                    best_type, best_callback = entry  # type: ignore[misc]
+                    best_end = matched.end()
+            else:
+                # The master match is zero-width, so every template's
+                # candidate lexeme is available from its capture group; keep
+                # the longest, breaking ties in favour of the later template,
+                # as before.
+                match_end = scan(text, start).end
+                for group, token_type, callback in meta:
+                    end = match_end(group)
+                    if end >= best_end and end != -1:
+                        best_end = end
+                        best_type = token_type
+                        best_callback = callback
+            if best_type is None:
+                raise UnknownSymbolError(text, counter.line, counter.column)
+            value: Any = text[start:best_end]
+            newlines = value.count(NEWLINE)
+            line = counter.line + newlines
+            column = 1 if newlines else counter.column
+            if best_callback:
+                value = best_callback(value)
+            accept(best_type, value, start, best_end, line, column)
+            counter.column = (1 if newlines
+                              else counter.column + best_end - start)
+            counter.start = best_end
+            counter.line = line
+        tokens = self.tokens
+        # Filtered-out tokens (typically whitespace) are never materialized
+        # as Token objects at all.
+        return tuple(tokens[i] for i in range(len(tokens))
+                     if tokens.token_types[i] not in filter_set)
 
@@ -1,8 +1,11 @@
 '''
 Tool for converting Roman numerals to Indian numerals and vice versa.
 '''
+from collections import Counter
+from functools import lru_cache
+
 __all__ = [
-    'encode_roman_numeral', 
+    'encode_roman_numeral',
     'decode_roman_numeral'
 ]
 __numerals: tuple[tuple[str, int], ...] = (
@@ -14,7 +17,33 @@ __numerals: tuple[tuple[str, int], ...] = (
     ('V', 5),
     ('I', 1)
 )
+# The full numeral table with the subtractive pairs in place lets the
+# encoder emit the canonical form directly, with no fix-up step.
+__pairs: tuple[tuple[str, int], ...] = (
+    ('M', 1000),
+    ('CM', 900),
+    ('D', 500),
+    ('CD', 400),
+    ('C', 100),
+    ('XC', 90),
+    ('L', 50),
+    ('XL', 40),
+    ('X', 10),
+    ('IX', 9),
+    ('V', 5),
+    ('IV', 4),
+    ('I', 1)
+)
+__subtractives: tuple[tuple[str, int], ...] = (
+    ('IV', 4),
+    ('IX', 9),
+    ('XL', 40),
+    ('XC', 90),
+    ('CD', 400),
+    ('CM', 900)
+)
 
+@lru_cache(maxsize=4096)
 def encode_roman_numeral(indian_numeral: int) -> str:
     '''
     Convert an Indian numeral between 1 and 3,999 to a Roman numeral.
@@ -47,23 +76,15 @@ def encode_roman_numeral(indian_numeral: int) -> str:
     '''
     if indian_numeral not in range(1, 4000):
         raise ValueError(f"Can only convert numbers 1-399 (number={indian_numeral})")
-    roman_numeral_: str = ''
-    for numeral, value in __numerals:
-        while indian_numeral >= value:
-            roman_numeral_ += numeral
-            indian_numeral -= value
-        for error, correction in {'IIII': 'IV',
-                                'VIV': 'IX',
-                                'XXXX': 'XL',
-                                'LXL': 'XC',
-                                'CCCC': 'CD',
-                                'DCD': 'CM'}.items():
-            if error in roman_numeral_:
-                roman_numeral_ = roman_numeral_.replace(error, correction)
-
-    return roman_numeral_
+    parts: list[str] = []
+    for numeral, value in __pairs:
+        quotient, indian_numeral = divmod(indian_numeral, value)
+        if quotient:
+            parts.append(numeral * quotient)
+    return ''.join(parts)
 
 
+@lru_cache(maxsize=4096)
 def decode_roman_numeral(symbol: str) -> int:
     '''
     Convert a Roman numeral to an Indian numeral.
@@ -89,18 +110,15 @@ def decode_roman_numeral(symbol: str) -> int:
     >>> decode_roman_numeral('CCLXIII')
     263
     '''
-    values: list[int] = []
-    for partial, value in {'IV': 4,
-                        'IX': 9,
-                        'XL': 40,
-                        'XC': 90,
-                        'CD': 400,
-                        'CM': 900}.items():
+    total = 0
+    for partial, value in __subtractives:
         if partial in symbol:
-            values.append(value)
+            total += value
             symbol = symbol.replace(partial, "")
+    # One histogram pass over the remaining symbols instead of one
+    # count() scan per numeral; a Counter returns 0 for missing keys.
+    counts = Counter(symbol)
     for numeral, value in __numerals:
-        if numeral in symbol:
-            values.append(value*symbol.count(numeral))
-    return sum(values)
+        total += value * counts[numeral]
+    return total
 
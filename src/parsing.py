@@ -3,15 +3,77 @@ Simple base classes for building text and token crawlers.
 
 These classes provide the boilerplate code for situations in which you want to
 roll your own tokenizer/lexer or parser. You must provide the main tokenize()
-or parse() functions in your subclass. 
+or parse() functions in your subclass.
+
+Performance notes
+-----------------
+The decision helpers already read the token/text buffers directly, but the
+main loop belongs to the subclass, and attribute reads are the dominant cost
+of an interpreter-bound crawl. In a hot tokenize()/parse() loop, bind what
+the loop touches to locals once and write the cursor back at sync points::
+
+    def parse(self):
+        tokens = self.tokens
+        current = self.current
+        n = len(tokens)
+        while current < n - 1:
+            ...                      # index tokens[current] directly
+        self.current = current       # sync before using the helpers again
 """
-from enum import Enum
-from typing import Optional
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from functools import wraps
+from typing import Any, Callable
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_MISS = object()
+
+
+def packrat(rule_id: int) -> Callable[[Callable[..., Any]],
+                                      Callable[..., Any]]:
+    """Decorate a Parser subclass rule method with packrat memoization.
+
+    The rule's result and ending cursor position are cached under
+    ``(rule_id, starting position)``, so each rule body runs at most once
+    per position and a backtracking parser degrades from exponential to
+    linear on pathological input. Give every decorated rule its own id,
+    and only decorate rules that take no arguments beyond ``self``, since
+    the cache key ignores arguments. The cache lives on the parser
+    instance and is cleared whenever a fresh instance is used per parse.
+    """
+    def decorator(rule: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(rule)
+        def wrapper(self: "Parser") -> Any:
+            key = (rule_id, self.current)
+            cache = self._packrat
+            hit = cache.get(key, _MISS)
+            if hit is not _MISS:
+                result, self.current = hit
+                return result
+            result = rule(self)
+            cache[key] = (result, self.current)
+            return result
+        return wrapper
+    return decorator
 
 
 class Token:
-    """Generic token."""
-    def __init__(self, token_type: Enum, lexeme: str) -> None:
+    """Generic token.
+
+    The [token_type] is a plain int so that check/match compare with a
+    C-level small-int equality instead of Enum.__eq__. Declare your token
+    types as an ``enum.IntEnum`` with small contiguous values to keep the
+    readable names while storing ints.
+    """
+    __slots__ = "token_type", "lexeme"
+
+    def __init__(self, token_type: int, lexeme: str) -> None:
         self.token_type = token_type
         self.lexeme = lexeme
 
@@ -19,49 +81,386 @@ class Token:
         return f"<{self.token_type}: {self.lexeme}>"
 
 
+# Sentinel appended after the last real token. With the sentinel in place,
+# peek() needs no bounds branch and is_at_end() is a plain type compare.
+# Keep subclass token types non-negative so they cannot collide with it.
+EOF_TOKEN_TYPE = -1
+EOF_TOKEN = Token(EOF_TOKEN_TYPE, "")
+
+# Sentinel returned by consume() on a mismatch. Testing ``token is
+# ERROR_TOKEN`` is a pointer compare, and the happy path stays free of
+# None-checks and allocations.
+ERROR_TOKEN_TYPE = -2
+ERROR_TOKEN = Token(ERROR_TOKEN_TYPE, "")
+
+
 class Tokenizer:
-    """Base functions for a generic tokenizer."""
+    """Base functions for a generic tokenizer.
+
+    The accessors are plain methods rather than properties so that the
+    per-character hot loop does not pay a descriptor dispatch on every read.
+    """
     def __init__(self):
         self.text: str = ""
         self.current: int = 0
         self.start: int = 0
         self.tokens: list[Token] = []
+        self._tok_i: int = 0
         self.line: int = 0
         self.line_chars: int = 0
+        self._text_len: int = 0
+        self._newlines: list[int] = []
+        # Cache of interned short lexemes, shared by _emit and the
+        # tokenize loops, so keyword/operator tokens reuse one str object.
+        self._intern: dict[str, str] = {}
+
+    def set_text(self, text: str) -> None:
+        """Load new input text and reset the cursor state.
+
+        The length is cached once here so that the per-character helpers
+        read a plain attribute instead of calling len() on every check,
+        and the newline positions are collected in one C-level pass so
+        that position() can derive (line, column) on demand. Assign input
+        through this method rather than setting ``text`` directly, or the
+        cached length goes stale.
+        """
+        self.text = text
+        self._text_len = len(text)
+        self._newlines = [match.start()
+                          for match in re.finditer("\n", text)]
+        # Preallocate the token buffer to a rough estimate (one token per
+        # four characters) so list.append's geometric regrowth copies are
+        # paid once up front; _emit fills slots by index and
+        # _trim_tokens() drops the unused tail.
+        self.tokens = [None] * (len(text) // 4 or 16)
+        self._tok_i = 0
+        self.current = 0
+        self.start = 0
+        self.line = 0
+        self.line_chars = 0
+
+    def position(self) -> tuple[int, int]:
+        """Return the cursor's (line, column), both counted from zero.
+
+        Derived in O(log lines) by bisecting the newline positions
+        collected in set_text(), so nothing in the per-character hot path
+        has to branch on newlines to keep counters current.
+        """
+        newlines = self._newlines
+        line = bisect_right(newlines, self.current - 1)
+        column = self.current - (newlines[line - 1] + 1 if line else 0)
+        return line, column
 
     def advance(self) -> str:
         """Advance the tokenizer and return the new current character."""
-        char = self.peek
-        self.current += 1
-        self.line_chars += 1
+        current = self.current
+        char = self.text[current] if current < self._text_len else "\0"
+        self.current = current + 1
         return char
 
-    @property
     def is_at_end(self) -> bool:
         """Signal whether we have reached the end of the stream."""
-        return self.current >= len(self.text)
+        return self.current >= self._text_len
 
-    @property
     def peek(self) -> str:
         """Return the current character without consuming it."""
-        if self.is_at_end:
-            return "\0"
-        return self.text[self.current]
+        current = self.current
+        return self.text[current] if current < self._text_len else "\0"
 
-    @property
     def previous(self) -> str:
         """Peek at the previous character."""
         return self.text[self.current - 1]
 
+    def scan_while(self, pattern: "re.Pattern[str]") -> str:
+        """Consume the longest match of [pattern] at the cursor and return
+        it, or return "" and stay put if the pattern does not match here.
+
+        This replaces a per-character advance()/peek() loop for a whole
+        run (an identifier, a digit string, a whitespace stretch) with a
+        single C-level regex match: compile the pattern once in the
+        subclass and call this from tokenize() instead of looping. The
+        line counters are re-derived from the new cursor position.
+        """
+        match = pattern.match(self.text, self.current)
+        if match is None:
+            return ""
+        self.current = match.end()
+        self.line, self.line_chars = self.position()
+        return match.group()
+
+    def _emit(self, token_type: int, lexeme: str) -> None:
+        """Append a token, interning the lexeme when it is short.
+
+        Keyword and operator lexemes are drawn from a tiny fixed
+        alphabet, but slicing the source text mints a fresh str per
+        token. Routing them through one interned copy lets downstream
+        equality checks short-circuit on pointer identity instead of
+        comparing characters. Subclass tokenize() loops should call this
+        instead of constructing Tokens directly.
+        """
+        if len(lexeme) <= 4:
+            lexeme = self._intern.setdefault(lexeme, sys.intern(lexeme))
+        tokens = self.tokens
+        tok_i = self._tok_i
+        if tok_i == len(tokens):
+            tokens.extend([None] * (len(tokens) or 16))
+        tokens[tok_i] = Token(token_type, lexeme)
+        self._tok_i = tok_i + 1
+
+    def _trim_tokens(self) -> list[Token]:
+        """Drop the unused preallocated tail and return the token list.
+
+        Call once at the end of tokenize(), after the last _emit.
+        """
+        del self.tokens[self._tok_i:]
+        return self.tokens
+
+
+class AsciiTokenizer(Tokenizer):
+    """Tokenizer that scans a bytes buffer instead of the str.
+
+    Indexing a str mints a fresh one-character string per peek; indexing
+    a memoryview of the encoded bytes returns a plain int with no
+    allocation, which for ASCII input removes the single largest
+    per-character cost of a pure-Python scanner. advance()/peek()/
+    previous() therefore return int byte values (0 at the end), and
+    subclass loops compare against ord constants::
+
+        if self.peek() == ord("("):
+            ...
+
+    The str is still kept for slicing lexemes, and byte offsets equal
+    character offsets, so scan_while() and position() work unchanged.
+    set_text() raises UnicodeEncodeError (a ValueError) on non-ASCII
+    input; catch it at the call site and fall back to the str-based
+    Tokenizer.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer: bytes = b""
+        self._view: memoryview = memoryview(b"")
+
+    def set_text(self, text: str) -> None:
+        """Load new ASCII input text and reset the cursor state."""
+        buffer = text.encode("ascii")
+        super().set_text(text)
+        self.buffer = buffer
+        self._view = memoryview(buffer)
+
+    def advance(self) -> int:
+        """Advance the tokenizer and return the new current byte."""
+        current = self.current
+        byte = self._view[current] if current < self._text_len else 0
+        self.current = current + 1
+        return byte
+
+    def peek(self) -> int:
+        """Return the current byte without consuming it."""
+        current = self.current
+        return self._view[current] if current < self._text_len else 0
+
+    def previous(self) -> int:
+        """Peek at the previous byte."""
+        return self._view[self.current - 1]
+
+
+class RegexTokenizer(Tokenizer):
+    """Tokenizer driven by one compiled regex instead of a character loop.
+
+    Subclasses declare ``(token_type, pattern)`` rules; the patterns are
+    joined into a single ``|``-alternation compiled once, so the inner
+    scan runs inside the C regex engine rather than one Python bytecode
+    step per character. Patterns are tried in declaration order at each
+    position, so list longer or more specific rules first.
+    """
+
+    def __init__(self, rules: list[tuple[int, str]]) -> None:
+        super().__init__()
+        self.rules = rules
+        self._master = re.compile(
+            "|".join(f"(?P<T{i}>{pattern})"
+                     for i, (_, pattern) in enumerate(rules))
+            or r"(?!)")
+        # lastgroup name -> token type, resolved once instead of parsing
+        # the group name back into an index per match.
+        self._types = {f"T{i}": token_type
+                       for i, (token_type, _) in enumerate(rules)}
+
+    def tokenize(self) -> list[Token]:
+        """Scan the loaded text and return the token list.
+
+        Text between matches (characters no rule covers) is skipped.
+        """
+        tokens = self.tokens
+        capacity = len(tokens)
+        tok_i = 0
+        types = self._types
+        intern_map = self._intern
+        for match in self._master.finditer(self.text):
+            lexeme = match.group()
+            if len(lexeme) <= 4:
+                lexeme = intern_map.setdefault(lexeme, sys.intern(lexeme))
+            if tok_i == capacity:
+                tokens.extend([None] * (capacity or 16))
+                capacity = len(tokens)
+            tokens[tok_i] = Token(types[match.lastgroup], lexeme)
+            tok_i += 1
+        self._tok_i = tok_i
+        self._trim_tokens()
+        tokens.append(EOF_TOKEN)
+        self.current = self._text_len
+        self.line, self.line_chars = self.position()
+        return tokens
+
+
+class HyperscanTokenizer(RegexTokenizer):
+    """RegexTokenizer with an optional DFA backend.
+
+    When the python-hyperscan package is installed, the rules are also
+    compiled into a single hyperscan database, and tokenize() collects
+    every match in one vectorized scan of the whole text instead of one
+    regex call per token. The DFA path supports only ASCII text and
+    resolves overlapping rules by longest match (ties going to the
+    earlier rule) rather than by declaration order; when the package is
+    missing or the text is not ASCII, tokenize() quietly falls back to
+    the inherited regex scan.
+    """
+
+    def __init__(self, rules: list[tuple[int, str]]) -> None:
+        super().__init__(rules)
+        self._database = None
+        if hyperscan is not None and rules:
+            self._database = hyperscan.Database()
+            self._database.compile(
+                expressions=[pattern.encode()
+                             for _, pattern in rules],
+                ids=list(range(len(rules))),
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(rules))
+
+    def tokenize(self) -> list[Token]:
+        """Scan the loaded text and return the token list."""
+        text = self.text
+        if self._database is None or not text.isascii():
+            return super().tokenize()
+        # One scan of the whole text; keep the longest match (ties to the
+        # earlier rule) recorded per start position.
+        table: dict[int, tuple[int, int]] = {}
+
+        def on_match(identifier: int, start: int, end: int,
+                     flags: int, context: Any = None) -> None:
+            entry = table.get(start)
+            if (entry is None or end > entry[0]
+                    or (end == entry[0] and identifier < entry[1])):
+                table[start] = (end, identifier)
+
+        self._database.scan(text.encode("ascii"),
+                            match_event_handler=on_match)
+        tokens = self.tokens
+        capacity = len(tokens)
+        tok_i = 0
+        rules = self.rules
+        intern_map = self._intern
+        position = 0
+        for start in sorted(table):
+            if start < position:
+                continue
+            end, identifier = table[start]
+            lexeme = text[start:end]
+            if len(lexeme) <= 4:
+                lexeme = intern_map.setdefault(lexeme, sys.intern(lexeme))
+            if tok_i == capacity:
+                tokens.extend([None] * (capacity or 16))
+                capacity = len(tokens)
+            tokens[tok_i] = Token(rules[identifier][0], lexeme)
+            tok_i += 1
+            position = end
+        self._tok_i = tok_i
+        self._trim_tokens()
+        tokens.append(EOF_TOKEN)
+        self.current = self._text_len
+        self.line, self.line_chars = self.position()
+        return tokens
+
+
+class _Checkpoint:
+    """Snapshot of a parser's cursor and error count for speculation.
+
+    Saving is two int reads — no copy of the token or error lists — so a
+    backtracking parser can checkpoint at every alternative for free.
+    rollback() restores the cursor and truncates any errors recorded
+    since the snapshot; commit() is a readability no-op for the accepted
+    branch. Used as a context manager, an exception escaping the block
+    rolls back automatically.
+    """
+    __slots__ = ("parser", "cursor", "error_count")
+
+    def __init__(self, parser: "Parser") -> None:
+        self.parser = parser
+        self.cursor = parser.current
+        self.error_count = len(parser.errors)
+
+    def rollback(self) -> None:
+        """Restore the cursor and discard errors recorded since the
+        snapshot."""
+        parser = self.parser
+        parser.current = self.cursor
+        del parser.errors[self.error_count:]
+
+    def commit(self) -> None:
+        """Accept the speculated branch; the snapshot is simply dropped."""
+
+    def __enter__(self) -> "_Checkpoint":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        if exc_type is not None:
+            self.rollback()
+        return False
+
 
 class Parser:
-    """Base functions for a generic parser."""
+    """Base functions for a generic parser.
+
+    The accessors are plain methods rather than properties so that the
+    per-token hot loop does not pay a descriptor dispatch on every read,
+    and the decision helpers (match, check, consume) read the token list
+    directly instead of going through the accessors.
+    """
 
     def __init__(self) -> None:
         self.tokens: list[Token] = []
+        # Structure-of-arrays companion to the token list: the type codes
+        # packed into a contiguous C int array, so the decision helpers
+        # stream plain ints instead of chasing a Token pointer per check.
+        self.types: array = array("i")
         self.current: int = 0
         self.start: int = 0
         self.errors: list[str] = []
+        self._tokens_len: int = 0
+        # Memo table for rules decorated with @packrat.
+        self._packrat: dict[tuple[int, int], tuple[Any, int]] = {}
+
+    def set_tokens(self, tokens: list[Token]) -> None:
+        """Load a new token stream and reset the cursor state.
+
+        The length is cached once here so that is_at_end() reads a plain
+        attribute instead of calling len() per check, and the packrat memo
+        table is cleared since its positions refer to the old stream.
+        Assign input through this method rather than setting ``tokens``
+        directly, or the cached length goes stale.
+
+        An EOF_TOKEN sentinel is appended if the stream does not already
+        end with one, so the lookahead helpers never index past the end.
+        """
+        if not tokens or tokens[-1].token_type != EOF_TOKEN_TYPE:
+            tokens.append(EOF_TOKEN)
+        self.tokens = tokens
+        self.types = array("i", (token.token_type for token in tokens))
+        self._tokens_len = len(tokens)
+        self.current = 0
+        self.start = 0
+        self._packrat.clear()
 
     def advance(self) -> Token:
         """Move the cursor forward and return the now-previous token."""
@@ -69,53 +468,189 @@ class Parser:
         self.current += 1
         return token
 
-    @property
     def is_at_end(self) -> bool:
         """Flag whether all tokens have been parsed."""
-        return self.current >= len(self.tokens) - 1
+        return self.types[self.current] == EOF_TOKEN_TYPE
 
-    @property
     def previous(self) -> Token:
-        """Return the token at the previous index, if it exists."""
-        if self.current >= 1:
-            return self.tokens[self.current - 1]
-        raise RuntimeError("Called previous at index 0.")
+        """Return the token at the previous index.
+
+        Only call this after at least one advance; the guard is an assert
+        so that -O builds pay no branch for an invariant that holds by
+        construction at every real call site.
+        """
+        assert self.current >= 1, "Called previous at index 0."
+        return self.tokens[self.current - 1]
 
-    @property
     def peek(self) -> Token:
         """Return the token at the current index without moving the cursor."""
         return self.tokens[self.current]
 
-    @property
-    def peek_next(self) -> Optional[Token]:
+    def peek_at(self, distance: int = 1) -> Token:
+        """Return the token [distance] indices ahead of the cursor, or the
+        EOF_TOKEN sentinel if that runs past the end of the stream.
+
+        This is O(1) lookahead without saving and restoring any parser
+        state; the cursor and the error list are untouched.
+        """
+        index = self.current + distance
+        if index < self._tokens_len:
+            return self.tokens[index]
+        return EOF_TOKEN
+
+    def peek_next(self) -> Token:
         """Return the token at the next index without moving the cursor."""
-        if not self.is_at_end:
-            return self.tokens[self.current + 1]
-        return None
+        return self.peek_at(1)
 
-    def match(self, *args: Enum) -> bool:
+    def match(self, *args: int) -> bool:
         """Test whether the given token(s)' type matches the type of the next
         token in the stream. If so, also advance the cursor.
         """
-        for arg in args:
-            if self.check(arg):
-                self.advance()
-                return True
+        if self.types[self.current] in args:
+            self.current += 1
+            return True
+        return False
+
+    def match_any(self, types: frozenset[int]) -> bool:
+        """Like ``match``, but against a pre-built set of token types.
+
+        Call sites with a fixed group of alternatives should build the
+        frozenset once at module scope; the hashed membership test then
+        replaces the linear scan over match() arguments.
+        """
+        if self.types[self.current] in types:
+            self.current += 1
+            return True
         return False
 
-    def check(self, token_type: Enum) -> bool:
-        """Test whether the given token type is the same as the type at the 
+    def check(self, token_type: int) -> bool:
+        """Test whether the given token type is the same as the type at the
         current index.
         """
-        return self.peek.token_type == token_type
+        return self.types[self.current] == token_type
+
+    def consume(self, token_type: int, message: str) -> Token:
+        """Consume a token.
 
-    def consume(self, token_type: Enum, message: str) -> Optional[Token]:
-        """Consume a token."""
-        if self.check(token_type):
-            return self.advance()
+        On a mismatch the error is recorded and the ERROR_TOKEN sentinel
+        comes back, so call sites test ``token is ERROR_TOKEN`` — a
+        pointer compare — rather than unwrapping an Optional.
+        """
+        current = self.current
+        if self.types[current] == token_type:
+            self.current = current + 1
+            return self.tokens[current]
         self.error(message)
-        return None
+        return ERROR_TOKEN
+
+    def compile_matcher(self, name: str,
+                        types: tuple[int, ...]) -> Callable[[], bool]:
+        """Generate a specialized check for a fixed set of token types.
+
+        Grammar call sites pass the same alternatives to match()/check()
+        on every invocation, but the generic helpers re-read them each
+        time. This bakes the types in as integer constants and returns a
+        zero-argument predicate bound to this parser whose body is
+        straight-line ``tt == A or tt == B`` compares — no tuple scan,
+        no set hash. Build each matcher once in the subclass __init__::
+
+            self.match_stmt_start = self.compile_matcher(
+                "match_stmt_start", (IF, WHILE, FOR))
+
+        Like check(), the predicate does not move the cursor.
+        """
+        checks = " or ".join(f"tt == {int(t)}" for t in types) or "False"
+        source = (f"def {name}(self):\n"
+                  f"    tt = self.types[self.current]\n"
+                  f"    return {checks}\n")
+        namespace: dict[str, Any] = {}
+        exec(source, namespace)
+        return namespace[name].__get__(self, type(self))
+
+    @staticmethod
+    def dispatch_table(entries: dict[int, Any]) -> list[Any]:
+        """Densify a dict of per-token-type entries into an indexable list.
+
+        Token types are small contiguous ints (declare them as an IntEnum
+        with values from 0), so a list with None gaps turns each dispatch
+        into a single C-level index instead of a dict hash-and-probe.
+        Build the tables once at module or __init__ scope.
+        """
+        table: list[Any] = [None] * (max(entries, default=-1) + 1)
+        for token_type, entry in entries.items():
+            table[token_type] = entry
+        return table
+
+    def run_pratt(self,
+                  prefix_table: list[Callable[["Parser", Token], Any]],
+                  infix_table: list[
+                      tuple[int, Callable[["Parser", Any, Token, Any],
+                                          Any]]],
+                  min_binding_power: int = 0) -> Any:
+        """Drive a Pratt (operator-precedence) parse without recursion.
+
+        The tables are lists indexed by token type — build them from dicts
+        with ``dispatch_table`` — so each dispatch is one list index.
+        ``prefix_table[tt]`` holds ``handler(parser, token)`` returning a
+        value for that token; ``infix_table[tt]`` holds ``(binding_power,
+        combine)`` where ``combine(parser, left, operator, right)`` builds
+        the result node. Operators are left-associative; a higher binding
+        power binds tighter.
+
+        Pending infix operations are kept on an explicit list-based stack
+        instead of the call stack, so deeply nested infix chains cannot
+        overflow Python's recursion limit and pay no per-level call frame.
+        Prefix handlers may still call run_pratt themselves for bracketed
+        sub-expressions.
+        """
+        stack: list[tuple[Any, Token, Callable[..., Any], int]] = []
+        limit = min_binding_power
+        tokens = self.tokens
+        types = self.types
+        # The sentinels are negative, which would wrap around a bare list
+        # index, so both lookups keep a range guard.
+        prefix_len = len(prefix_table)
+        infix_len = len(infix_table)
+        while True:
+            current = self.current
+            token_type = types[current]
+            self.current = current + 1
+            handler = (prefix_table[token_type]
+                       if 0 <= token_type < prefix_len else None)
+            if handler is None:
+                self.error(f"Unexpected token: {tokens[current]!r}")
+                return None
+            left = handler(self, tokens[current])
+            while True:
+                token_type = types[self.current]
+                entry = (infix_table[token_type]
+                         if 0 <= token_type < infix_len else None)
+                if entry is not None and entry[0] >= limit:
+                    binding_power, combine = entry
+                    operator = tokens[self.current]
+                    self.current += 1
+                    stack.append((left, operator, combine, limit))
+                    limit = binding_power + 1
+                    break
+                if not stack:
+                    return left
+                previous_left, operator, combine, limit = stack.pop()
+                left = combine(self, previous_left, operator, left)
+
+    def checkpoint(self) -> _Checkpoint:
+        """Snapshot the cursor and error count before speculating.
+
+        Try an alternative, then call rollback() on the returned object
+        if it fails (or commit() if it succeeds)::
+
+            mark = self.checkpoint()
+            node = self.try_alternative_a()
+            if node is None:
+                mark.rollback()
+                node = self.try_alternative_b()
+        """
+        return _Checkpoint(self)
 
     def error(self, message: str) -> None:
         """Register an error."""
-        self.errors.append(message)
\ No newline at end of file
+        self.errors.append(message)